@@ -39,15 +39,11 @@ from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
 from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
-from spyder.plugins.projects.widgets.projectdialog import (
-    is_writable,
-    ProjectDialog,
-)
 from spyder.plugins.projects.widgets.projectexplorer import (
     ProjectExplorerTreeWidget)
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
-from spyder.utils.misc import getcwd_or_home
+from spyder.utils.misc import getcwd_or_home, is_writable
 from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
 
@@ -316,6 +312,12 @@ class ProjectExplorerWidget(PluginMainWidget):
         """Create new project."""
         self._unmaximize()
 
+        # This is imported here because the dialog is rarely used and
+        # importing it takes time, which would slow down Spyder startup.
+        from spyder.plugins.projects.widgets.projectdialog import (
+            ProjectDialog
+        )
+
         dlg = ProjectDialog(self)
         result = dlg.exec_()
         data = dlg.project_data
@@ -9,15 +9,17 @@
 
 # Standard library imports
 from __future__ import annotations
+from enum import IntFlag
+import functools
 import os
 import os.path as osp
 import re
 from pathlib import Path
+import stat
 import sys
-from typing import TypedDict
 
 # Third party imports
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtWidgets import (
     QDialogButtonBox,
     QHBoxLayout,
@@ -30,9 +32,12 @@ from qtpy.QtWidgets import (
 from spyder.api.fonts import SpyderFontType, SpyderFontsMixin
 from spyder.api.translations import _
 from spyder.api.widgets.dialogs import SpyderDialogButtonBox
+from spyder.config.user import NoDefault
 from spyder.plugins.projects.api import EmptyProject
 from spyder.utils.icon_manager import ima
+from spyder.utils.misc import is_writable, isdir
 from spyder.utils.stylesheet import AppStyle, MAC, WIN
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.config import SpyderConfigPage
 from spyder.widgets.sidebardialog import SidebarDialog
 from spyder.widgets.helperwidgets import MessageLabel
@@ -41,31 +46,155 @@ from spyder.widgets.helperwidgets import MessageLabel
 # =============================================================================
 # ---- Auxiliary functions and classes
 # =============================================================================
-def is_writable(path):
+def is_dir_stat(path):
     """
-    Check if path has write access.
+    Return the stat result of path if it's a directory, else None.
 
-    Solution taken from https://stackoverflow.com/a/11170037
+    This allows to reuse the result of a single stat call for several checks.
     """
-    filepath = osp.join(path, "__spyder_write_test__.txt")
-
     try:
-        filehandle = open(filepath, 'w')
-        filehandle.close()
-        os.remove(filepath)
-    except (FileNotFoundError, PermissionError):
-        return False
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+    return st if stat.S_ISDIR(st.st_mode) else None
+
+
+class ValidationReasons(IntFlag):
+    """Reasons why the validation of a project page failed."""
+
+    MissingInfo = 1
+    NoLocation = 2
+    LocationExists = 4
+    LocationNotWritable = 8
+    SpyderProjectExists = 16
+    WrongName = 32
+
+
+def _check_location(location, name, stamp, probe_write=False):
+    """
+    Check if location can be used to create a project.
+
+    Parameters
+    ----------
+    location: str
+        Directory to check.
+    name: str or None
+        Name of the project directory to create in location. If None,
+        location is checked to be used as an existing project directory.
+    stamp: tuple or None
+        Modification and change times of location, or None if it's not a
+        directory. It's only used to invalidate cached results when location
+        changes on disk.
+    probe_write: bool
+        Whether to check write access with is_writable, which writes a file
+        to location on Windows, or only with os.access.
+
+    Returns
+    -------
+    tuple
+        The validation reasons found (as a ValidationReasons flag) and the
+        tooltip to show for them (None if there's no tooltip).
+    """
+    # Checks are ordered by cost, so the ones that only need the stat result
+    # or the path go first.
+    if stamp is None:
+        return (
+            ValidationReasons.NoLocation,
+            _("This directory doesn't exist"),
+        )
+
+    if os.name == "nt" and any(
+        [re.search(r":", part) for part in Path(location).parts[1:]]
+    ):
+        # Prevent creating a project in directory with colons.
+        # Fixes spyder-ide/spyder#16942
+        return ValidationReasons.WrongName, None
+
+    if probe_write:
+        writable = is_writable(location)
+    else:
+        writable = os.access(location, os.W_OK)
+
+    if not writable:
+        return (
+            ValidationReasons.LocationNotWritable,
+            _("This directory is not writable"),
+        )
+
+    # Only a single child of location needs to be checked: the project
+    # directory for new projects or the .spyproject one for existing
+    # directories. So we look for it with a single call.
+    child = name if name is not None else '.spyproject'
+    child_exists = isdir(osp.join(location, child))
+
+    if name is not None:
+        found = ValidationReasons(0)
+        if os.name == "nt" and re.search(r":", name):
+            # Prevent creating a project in directory with colons.
+            # Fixes spyder-ide/spyder#16942
+            found |= ValidationReasons.WrongName
+        if child_exists:
+            found |= ValidationReasons.LocationExists
+        return found, None
+    elif child_exists:
+        return (
+            ValidationReasons.SpyderProjectExists,
+            _("You selected a Spyder project"),
+        )
+
+    return ValidationReasons(0), None
+
+
+@functools.lru_cache(maxsize=32)
+def check_location(location, name, stamp):
+    """
+    Memoized version of _check_location used while users type a location.
+
+    Results are reused while stamp doesn't change. Write access is only
+    checked with os.access here, so no file is written to location.
+    """
+    return _check_location(location, name, stamp, probe_write=False)
+
+
+def get_location_stamp(location):
+    """
+    Get the modification and change times of location.
+
+    These are used to know if cached validation results for location are
+    still valid. Returns None if location is not a directory.
+    """
+    location_stat = is_dir_stat(location)
+    return (
+        (location_stat.st_mtime_ns, location_stat.st_ctime_ns)
+        if location_stat is not None
+        else None
+    )
+
+
+def get_location_status(
+    location, name=None, probe_write=False, stamp=NoDefault
+):
+    """
+    Get the validation reasons and tooltip for location.
 
-    return True
+    This only accesses the filesystem, so it's safe to call it from a
+    worker thread. See _check_location for the meaning of the parameters.
+    If stamp is not given, it's computed with get_location_stamp.
 
+    Results are cached when probe_write is False. Otherwise, the checks are
+    always done because they are used to decide if a project can be created,
+    so they must reflect the current state of the filesystem. Besides, on
+    Windows the creation time is returned as st_ctime before Python 3.12, so
+    permission changes are not reflected in stamp.
+    """
+    if stamp is NoDefault:
+        stamp = get_location_stamp(location)
 
-class ValidationReasons(TypedDict):
-    missing_info: bool | None
-    no_location: bool | None
-    location_exists: bool | None
-    location_not_writable: bool | None
-    spyder_project_exists: bool | None
-    wrong_name: bool | None
+    if probe_write:
+        return _check_location(location, name, stamp, probe_write=True)
+    else:
+        return check_location(location, name, stamp)
 
 
 # =============================================================================
@@ -85,20 +214,65 @@ class BaseProjectPage(SpyderConfigPage, SpyderFontsMixin):
     LOCATION_TEXT = _("Location")
     LOCATION_TIP = None
 
+    # Texts to show for failed validations. These are computed here to avoid
+    # translating them every time a page is validated.
+    _REASON_TEXTS = {
+        ValidationReasons.LocationExists: _(
+            "The directory you selected for this project already exists."
+        ),
+        ValidationReasons.SpyderProjectExists: _(
+            "This directory is already a Spyder project."
+        ),
+        ValidationReasons.LocationNotWritable: _(
+            "You don't have write permissions in the location you selected."
+        ),
+        ValidationReasons.NoLocation: _(
+            "The location you selected doesn't exist."
+        ),
+        ValidationReasons.WrongName: _(
+            "The directory name you selected is not valid."
+        ),
+        ValidationReasons.MissingInfo: _(
+            "There are missing fields on this page."
+        ),
+    }
+    _LOCATION_REASONS = (
+        ValidationReasons.LocationExists
+        | ValidationReasons.SpyderProjectExists
+        | ValidationReasons.LocationNotWritable
+        | ValidationReasons.NoLocation
+    )
+
+    # Icon shown for failed validations. It's the same for all pages, so
+    # it's created only once.
+    _ERROR_ICON = None
+
     def __init__(self, parent):
         super().__init__(parent)
 
+        if BaseProjectPage._ERROR_ICON is None:
+            BaseProjectPage._ERROR_ICON = ima.icon("error")
+
         self._location = self.create_browsedir(
             text=self.LOCATION_TEXT,
             option=None,
             alignment=Qt.Vertical,
             tip=self.LOCATION_TIP,
-            status_icon=ima.icon("error"),
+            status_icon=self._ERROR_ICON,
+        )
+
+        self._location.browse_btn.clicked.connect(
+            self._reset_validation_cache
         )
 
         self._validation_label = MessageLabel(self)
         self._validation_label.setVisible(False)
 
+        # Last validation state shown to users, to only update widgets when
+        # it changes.
+        self._last_status = {}
+        self._last_validation_text = ""
+
         self._description_font = self.get_font(SpyderFontType.Interface)
         self._description_font.setPointSize(
             self._description_font.pointSize() + 1
@@ -115,6 +289,10 @@ class BaseProjectPage(SpyderConfigPage, SpyderFontsMixin):
         """Actions to take to validate the page contents."""
         raise NotImplementedError
 
+    def stop_validation(self):
+        """Stop validations running in the background, if any."""
+        pass
+
     @property
     def project_type(self):
         """Project type associated to this page."""
@@ -125,104 +303,102 @@ class BaseProjectPage(SpyderConfigPage, SpyderFontsMixin):
     def _validate_location(
         self,
         location: str,
-        reasons: ValidationReasons | None = None,
+        reasons: ValidationReasons = ValidationReasons(0),
         name: str | None = None
     ) -> ValidationReasons:
 
-        if reasons is None:
-            reasons: ValidationReasons = {}
-
         if not location:
-            self._location.status_action.setVisible(True)
-            self._location.status_action.setToolTip(_("This is empty"))
-            reasons["missing_info"] = True
-        elif not osp.isdir(location):
-            self._location.status_action.setVisible(True)
-            self._location.status_action.setToolTip(
-                _("This directory doesn't exist")
-            )
-            reasons["no_location"] = True
-        elif not is_writable(location):
-            self._location.status_action.setVisible(True)
-            self._location.status_action.setToolTip(
-                _("This directory is not writable")
+            self._set_status(self._location, True, _("This is empty"))
+            reasons |= ValidationReasons.MissingInfo
+        else:
+            reasons = self._set_location_status(
+                self._get_creation_status(location, name), reasons
             )
-            reasons["location_not_writable"] = True
-        elif os.name == "nt" and any(
-            [re.search(r":", part) for part in Path(location).parts[1:]]
-        ):
-            # Prevent creating a project in directory with colons.
-            # Fixes spyder-ide/spyder#16942
-            reasons["wrong_name"] = True
-        elif name is not None:
-            project_path = osp.join(location, name)
-            if os.name == "nt" and re.search(r":", name):
-                # Prevent creating a project in directory with colons.
-                # Fixes spyder-ide/spyder#16942
-                reasons["wrong_name"] = True
-            if osp.isdir(project_path):
-                reasons["location_exists"] = True
+
+        return reasons
+
+    def _get_creation_status(self, location: str, name: str | None = None):
+        """
+        Get the status of location when users request to create a project.
+
+        That's the right moment to check write access thoroughly.
+        """
+        return get_location_status(location, name, probe_write=True)
+
+    def _reset_validation_cache(self):
+        """
+        Discard cached validation results.
+
+        Users selecting a directory explicitly expect it to be checked again,
+        even if we have a cached result for it.
+        """
+        check_location.cache_clear()
+
+    def _set_location_status(
+        self,
+        status: tuple,
+        reasons: ValidationReasons,
+    ) -> ValidationReasons:
+        """Add the status returned by get_location_status to the page."""
+        found, tooltip = status
+        reasons |= found
+
+        if tooltip:
+            self._set_status(self._location, True, tooltip)
         else:
-            spyproject_path = osp.join(location, '.spyproject')
-            if osp.isdir(spyproject_path):
-                self._location.status_action.setVisible(True)
-                self._location.status_action.setToolTip(
-                    _("You selected a Spyder project")
-                )
-                reasons["spyder_project_exists"] = True
+            self._set_status(self._location, False)
 
         return reasons
 
-    def _compose_failed_validation_text(self, reasons: ValidationReasons):
-        n_reasons = list(reasons.values()).count(True)
-        prefix = "- " if n_reasons > 1 else ""
-        suffix = "<br>" if n_reasons > 1 else ""
-
-        text = ""
-        if reasons.get("location_exists"):
-            text += (
-                prefix
-                + _(
-                    "The directory you selected for this project already "
-                    "exists."
-                )
-                + suffix
-            )
-        elif reasons.get("spyder_project_exists"):
-            text += (
-                prefix
-                + _("This directory is already a Spyder project.")
-                + suffix
-            )
-        elif reasons.get("location_not_writable"):
-            text += (
-                prefix
-                + _(
-                    "You don't have write permissions in the location you "
-                    "selected."
-                )
-                + suffix
-            )
-        elif reasons.get("no_location"):
-            text += (
-                prefix
-                + _("The location you selected doesn't exist.")
-                + suffix
-            )
+    def _set_status(self, widget, visible: bool, tooltip: str | None = None):
+        """Show or hide the status icon of widget, if that changed."""
+        last_status = self._last_status
+        status = (visible, tooltip if visible else None)
+        if last_status.get(widget) == status:
+            return
 
-        if reasons.get("wrong_name"):
-            text += (
-                prefix
-                + _("The directory name you selected is not valid.")
-            )
+        last_status[widget] = status
+        status_action = widget.status_action
+        status_action.setVisible(visible)
+        if visible:
+            status_action.setToolTip(tooltip)
 
-        if reasons.get("missing_info"):
-            text += (
-                prefix
-                + _("There are missing fields on this page.")
-            )
+    def _set_validation_text(self, text: str):
+        """Show text in the validation label or hide it if text is empty."""
+        if text == self._last_validation_text:
+            return
+
+        self._last_validation_text = text
+        validation_label = self._validation_label
+        if text:
+            validation_label.set_text(text)
+        validation_label.setVisible(bool(text))
 
-        return text
+    def _show_validation_reasons(self, reasons: ValidationReasons):
+        self._set_validation_text(
+            self._compose_failed_validation_text(reasons) if reasons else ""
+        )
+
+    def _compose_failed_validation_text(self, reasons: ValidationReasons):
+        # Only the first location reason found is shown, followed by the
+        # other ones.
+        shown = []
+        location_shown = False
+        for reason, text in self._REASON_TEXTS.items():
+            if not reasons & reason:
+                continue
+
+            if reason & self._LOCATION_REASONS:
+                if location_shown:
+                    continue
+                location_shown = True
+
+            shown.append(text)
+
+        if len(shown) > 1:
+            return "<br>".join("- " + text for text in shown)
+        else:
+            return "".join(shown)
 
 
 class NewDirectoryPage(BaseProjectPage):
@@ -261,7 +437,7 @@ class NewDirectoryPage(BaseProjectPage):
                 "A directory with this name will be created in the location "
                 "below"
             ),
-            status_icon=ima.icon("error"),
+            status_icon=self._ERROR_ICON,
         )
 
         layout = QVBoxLayout()
@@ -289,34 +465,22 @@ class NewDirectoryPage(BaseProjectPage):
         location_text = self._location.textbox.text()
         location = osp.normpath(location_text) if location_text else ""
 
-        # Clear validation state
-        self._validation_label.setVisible(False)
-        for widget in [self._name, self._location]:
-            widget.status_action.setVisible(False)
-
         # Perform validation
-        reasons: ValidationReasons = {}
+        reasons = ValidationReasons(0)
+        name_tooltip = None
         if not name:
-            self._name.status_action.setVisible(True)
-            self._name.status_action.setToolTip(_("This is empty"))
-            reasons["missing_info"] = True
+            name_tooltip = _("This is empty")
+            reasons |= ValidationReasons.MissingInfo
 
         reasons = self._validate_location(location, reasons, name)
-        if reasons:
-            if reasons.get("location_exists"):
-                self._name.status_action.setVisible(True)
-                self._name.status_action.setToolTip(
-                    _("A directory with this name already exists")
-                )
-            if reasons.get("wrong_name"):
-                self._name.status_action.setVisible(True)
-                self._name.status_action.setToolTip(
-                    _("The project directory can't contain ':'")
-                )
-            self._validation_label.set_text(
-                self._compose_failed_validation_text(reasons)
-            )
-            self._validation_label.setVisible(True)
+        if reasons & ValidationReasons.LocationExists:
+            name_tooltip = _("A directory with this name already exists")
+        if reasons & ValidationReasons.WrongName:
+            name_tooltip = _("The project directory can't contain ':'")
+
+        # Show validation state
+        self._set_status(self._name, name_tooltip is not None, name_tooltip)
+        self._show_validation_reasons(reasons)
 
         return False if reasons else True
 
@@ -327,6 +491,41 @@ class ExistingDirectoryPage(BaseProjectPage):
     LOCATION_TEXT = _("Project path")
     LOCATION_TIP = _("Select the directory to use for the project")
 
+    # Time in ms to wait after the last edit of the location before
+    # validating it
+    VALIDATION_DELAY = 200
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        # Validate the location while users type in it, but coalesce rapid
+        # edits so the filesystem is not probed on every keystroke.
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATION_DELAY)
+        self._validate_timer.timeout.connect(self._do_validate)
+        self._location.textbox.textChanged.connect(self._on_location_edited)
+
+        # The filesystem checks done while typing run on a thread to not
+        # block the interface on slow (e.g. network) drives. Only one of
+        # them runs at a time (see _do_validate), so they don't pile up
+        # behind one that's blocked.
+        self._worker_manager = WorkerManager(self)
+        self._validation_worker = None
+        self._validation_location = None
+        self._validation_pending = False
+
+        # Location and stamp of the last validation requested by clicking
+        # Create, and its status. Used to not validate it again if nothing
+        # changed on disk.
+        self._last_creation_key = None
+        self._last_creation_status = None
+
+        # Last location text and its normalized version, to avoid
+        # normalizing the same text several times.
+        self._location_text = None
+        self._normalized_location = None
+
     def get_name(self):
         return _("Existing directory")
 
@@ -351,27 +550,123 @@ class ExistingDirectoryPage(BaseProjectPage):
 
     @property
     def project_location(self):
-        return osp.normpath(self._location.textbox.text())
+        return self._normalize_location()
 
     def validate_page(self):
-        # Clear validation state
-        self._validation_label.setVisible(False)
-        self._location.status_action.setVisible(False)
-
-        # Avoid using "." as location, which is the result of os.normpath("")
-        location_text = self._location.textbox.text()
-        location = osp.normpath(location_text) if location_text else ""
+        # No need to validate again if there's a pending validation and
+        # results of the running one are not necessary anymore.
+        self._discard_validation()
 
         # Perform validation
-        reasons = self._validate_location(location)
-        if reasons:
-            self._validation_label.set_text(
-                self._compose_failed_validation_text(reasons)
-            )
-            self._validation_label.setVisible(True)
+        reasons = self._validate_location(self._get_location())
+        self._show_validation_reasons(reasons)
 
         return False if reasons else True
 
+    def stop_validation(self):
+        # The running worker is not terminated because that would block the
+        # interface until its filesystem checks finish, which could take a
+        # long time on slow drives. Its results are simply discarded.
+        self._discard_validation()
+        self._validation_worker = None
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _normalize_location(self):
+        location_text = self._location.textbox.text()
+        if location_text != self._location_text:
+            self._location_text = location_text
+            self._normalized_location = osp.normpath(location_text)
+
+        return self._normalized_location
+
+    def _get_location(self):
+        location = self._normalize_location()
+
+        # Avoid using "." as location, which is the result of os.normpath("")
+        return location if self._location_text else ""
+
+    def _get_creation_status(self, location: str, name: str | None = None):
+        # Reuse the last result if location didn't change on disk since then
+        # (e.g. if users click Create several times). That's not done on
+        # Windows because its stamp doesn't reflect permission changes before
+        # Python 3.12 and probing write access changes it anyway.
+        stamp = get_location_stamp(location)
+        key = (location, stamp)
+        if os.name != "nt" and key == self._last_creation_key:
+            return self._last_creation_status
+
+        status = get_location_status(
+            location, name, probe_write=True, stamp=stamp
+        )
+        self._last_creation_key = key
+        self._last_creation_status = status
+
+        return status
+
+    def _reset_validation_cache(self):
+        super()._reset_validation_cache()
+        self._last_creation_key = None
+        self._last_creation_status = None
+
+    def _discard_validation(self):
+        """Discard pending validations and results of the running one."""
+        self._validate_timer.stop()
+        self._validation_location = None
+        self._validation_pending = False
+
+    def _on_location_edited(self):
+        """Restart the validation delay."""
+        self._validate_timer.start()
+
+    def _do_validate(self):
+        """Validate the page after users stopped editing the location."""
+        location = self._get_location()
+
+        # No need to access the filesystem to validate empty locations
+        if not location:
+            self.validate_page()
+            return
+
+        # Wait for the running validation to finish before starting a new
+        # one. Note that we can't terminate its worker because that would
+        # prevent its thread from quitting.
+        if self._validation_worker is not None:
+            self._validation_pending = True
+            return
+
+        worker = self._worker_manager.create_python_worker(
+            get_location_status, location
+        )
+        worker.sig_finished.connect(self._on_location_status_ready)
+        self._validation_worker = worker
+        self._validation_location = location
+        worker.start()
+
+    def _on_location_status_ready(self, worker, output, error):
+        """Show the results of validating the location on a thread."""
+        if worker is not self._validation_worker:
+            return
+
+        self._validation_worker = None
+
+        # The location was edited while validating it, so validate it again
+        if self._validation_pending:
+            self._validation_pending = False
+            self._do_validate()
+            return
+
+        # Discard results that are not necessary anymore or correspond to a
+        # location that's no longer current.
+        if (
+            error is not None
+            or self._validation_location != self._get_location()
+        ):
+            return
+
+        reasons = self._set_location_status(output, ValidationReasons(0))
+        self._show_validation_reasons(reasons)
+
 
 # =============================================================================
 # ---- Dialog
@@ -385,6 +680,10 @@ class ProjectDialog(SidebarDialog):
     PAGES_MINIMUM_WIDTH = 450
     PAGE_CLASSES = [NewDirectoryPage, ExistingDirectoryPage]
 
+    # Window icon. It's created the first time the dialog is built and
+    # reused after that.
+    _WINDOW_ICON = None
+
     sig_project_creation_requested = Signal(str, str, object)
     """
     This signal is emitted to request the Projects plugin the creation of a
@@ -409,7 +708,21 @@ class ProjectDialog(SidebarDialog):
             self.windowFlags() & ~Qt.WindowContextHelpButtonHint
         )
         self.setWindowTitle(_('Create new project'))
-        self.setWindowIcon(ima.icon("project_new"))
+
+        if ProjectDialog._WINDOW_ICON is None:
+            ProjectDialog._WINDOW_ICON = ima.icon("project_new")
+        self.setWindowIcon(self._WINDOW_ICON)
+
+    # ---- Qt methods
+    # -------------------------------------------------------------------------
+    def done(self, result):
+        """Stop background validations of pages when the dialog finishes."""
+        for index in range(self.number_of_pages()):
+            page = self.get_page(index)
+            if isinstance(page, BaseProjectPage):
+                page.stop_validation()
+
+        super().done(result)
 
     def create_buttons(self):
         bbox = SpyderDialogButtonBox(
@@ -9,18 +9,16 @@ Tests for projectdialog.py
 """
 
 # Standard library imports
-from contextlib import contextmanager
 import os
-import subprocess
 
 # Third party imports
 import pytest
 
 # Local imports
-from spyder.config.base import running_in_ci
+from spyder.plugins.projects.widgets import projectdialog
 from spyder.plugins.projects.widgets.projectdialog import (
-    is_writable,
     ProjectDialog,
+    ValidationReasons,
 )
 
 
@@ -104,45 +102,174 @@ def test_directory_validations(projects_dialog, tmp_path, qtbot):
     )
 
 
-def test_directory_is_writable(tmp_path):
-    """Test if we can correctly detect of a directory is writable."""
-    read_only_dir = tmp_path / "read_only_dir"
-    read_only_dir.mkdir()
-
-    # Make the directory read-only.
-    if os.name == "nt":
-        # From https://stackoverflow.com/a/66130551
-        @contextmanager
-        def set_access_right(path, access):
-            def cmd(access_right):
-                return [
-                    "icacls",
-                    str(path),
-                    "/inheritance:r",
-                    "/grant:r",
-                    f"Everyone:{access_right}",
-                ]
-
-            try:
-                subprocess.check_output(cmd(access))
-                yield path
-            finally:
-                subprocess.check_output(cmd("F")) # F -> full access again
-
-        # This doesn't work on CIs but passes locally
-        if not running_in_ci():
-            with set_access_right(read_only_dir, "R") as path: # R -> Read-only
-                assert not is_writable(str(path))
-
-        # Also check that is_writable can deal with UNC paths.
-        assert not is_writable("\\Users")
-    else:
-        # From https://stackoverflow.com/a/70933772
-        read_only_dir.chmod(0o444)
-        assert not is_writable(str(read_only_dir))
-
-        # Make it read-write again to delete it
-        read_only_dir.chmod(0o644)
+def test_existing_directory_validation_delay(projects_dialog, tmp_path, qtbot):
+    """
+    Test that the location of the existing directory page is validated only
+    after users stop typing in it.
+    """
+    dlg = projects_dialog
+    dlg.set_current_index(1)
+    page = dlg.get_page()
+
+    page._location.textbox.setText(str(tmp_path / "foo"))
+
+    # Nothing is validated before the delay has passed
+    assert page._validate_timer.isActive()
+    assert page._validate_timer.interval() == page.VALIDATION_DELAY
+    assert not page._validation_label.isVisible()
+
+    # Check the location is validated after it
+    qtbot.waitUntil(page._validation_label.isVisible)
+    assert not page._validate_timer.isActive()
+    assert (
+        page._validation_label.text()
+        == "The location you selected doesn't exist."
+    )
+
+
+def test_existing_directory_stale_validation(projects_dialog, tmp_path, qtbot):
+    """
+    Test that results of validating a location on a thread are discarded if
+    the location was changed meanwhile.
+    """
+    dlg = projects_dialog
+    dlg.set_current_index(1)
+    page = dlg.get_page()
+
+    # Start validating a Spyder project directory
+    folder = tmp_path / 'foo'
+    (folder / '.spyproject').mkdir(parents=True)
+    page._location.textbox.setText(str(folder))
+    page._validate_timer.stop()
+    page._do_validate()
+    assert page._validation_worker is not None
+
+    # Change the location before the results are processed, and prevent it
+    # to be validated.
+    page._location.textbox.setText(str(tmp_path))
+    page._validate_timer.stop()
+
+    # Check the results of the first validation were not shown
+    qtbot.waitUntil(lambda: page._validation_worker is None)
+    assert not page._validation_label.isVisible()
+    assert not page._location.status_action.isVisible()
+
+
+def test_existing_directory_cached_validation(
+    projects_dialog, tmp_path, qtbot
+):
+    """
+    Test that validation results of a location are cached while it doesn't
+    change on disk, and not reused after it does.
+    """
+    dlg = projects_dialog
+    dlg.set_current_index(1)
+    page = dlg.get_page()
+    check_location = projectdialog.check_location
+    check_location.cache_clear()
+
+    def wait_for_validation():
+        qtbot.waitUntil(
+            lambda: (
+                not page._validate_timer.isActive()
+                and page._validation_worker is None
+            )
+        )
+
+    # Validate a directory that can be used for a project
+    folder = tmp_path / 'foo'
+    folder.mkdir()
+    page._location.textbox.setText(str(folder))
+    wait_for_validation()
+    assert not page._validation_label.isVisible()
+    assert check_location.cache_info().misses == 1
+    assert check_location.cache_info().hits == 0
+
+    # Type the same location again (the trailing separator is removed when
+    # normalizing it) and check the cached result is used.
+    page._location.textbox.setText(str(folder) + os.sep)
+    wait_for_validation()
+    assert not page._validation_label.isVisible()
+    assert check_location.cache_info().misses == 1
+    assert check_location.cache_info().hits == 1
+
+    # Turn it into a Spyder project and type the same location again
+    (folder / '.spyproject').mkdir()
+    page._location.textbox.setText(str(folder))
+
+    # Check that the new state of the directory is detected
+    qtbot.waitUntil(page._validation_label.isVisible)
+    assert check_location.cache_info().misses == 2
+    assert (
+        page._validation_label.text()
+        == "This directory is already a Spyder project."
+    )
+
+
+def test_failed_validation_text(projects_dialog):
+    """Test the text shown for different combinations of failed validations."""
+    page = projects_dialog.get_page()
+
+    # Single reason
+    assert (
+        page._compose_failed_validation_text(ValidationReasons.WrongName)
+        == "The directory name you selected is not valid."
+    )
+
+    # Several reasons are shown in different lines
+    assert page._compose_failed_validation_text(
+        ValidationReasons.WrongName | ValidationReasons.MissingInfo
+    ) == (
+        "- The directory name you selected is not valid.<br>"
+        "- There are missing fields on this page."
+    )
+
+    # Only the first reason related to the location is shown
+    assert page._compose_failed_validation_text(
+        ValidationReasons.LocationExists
+        | ValidationReasons.NoLocation
+        | ValidationReasons.MissingInfo
+    ) == (
+        "- The directory you selected for this project already exists.<br>"
+        "- There are missing fields on this page."
+    )
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Not cached on Windows")
+def test_existing_directory_create_validation(
+    projects_dialog, tmp_path, monkeypatch
+):
+    """
+    Test that validations requested by clicking Create are not done again
+    if the location didn't change on disk.
+    """
+    dlg = projects_dialog
+    dlg.set_current_index(1)
+    page = dlg.get_page()
+
+    calls = []
+    check_location = projectdialog._check_location
+
+    def counted_check_location(*args, **kwargs):
+        calls.append(args)
+        return check_location(*args, **kwargs)
+
+    monkeypatch.setattr(
+        projectdialog, "_check_location", counted_check_location
+    )
+
+    # Validate the same location twice
+    folder = tmp_path / 'foo'
+    folder.mkdir()
+    page._location.textbox.setText(str(folder))
+    assert page.validate_page()
+    assert page.validate_page()
+    assert len(calls) == 1
+
+    # Check it's validated again after it changes on disk
+    (folder / '.spyproject').mkdir()
+    assert not page.validate_page()
+    assert len(calls) == 2
 
 
 if __name__ == "__main__":
@@ -240,6 +240,73 @@ def get_common_path(pathlist):
                 return osp.abspath(common)
 
 
+def is_writable(path):
+    """
+    Check if path has write access.
+
+    On Posix systems this is a single access(2) call. On Windows, os.access
+    only looks at the read-only attribute and ignores ACLs, so we need to
+    probe the directory by writing a file to it.
+
+    Solution for Windows taken from https://stackoverflow.com/a/11170037
+    """
+    if os.name != "nt":
+        return os.access(path, os.W_OK)
+
+    filepath = osp.join(path, "__spyder_write_test__.txt")
+
+    try:
+        filehandle = open(filepath, 'w')
+        filehandle.close()
+        os.remove(filepath)
+    except (FileNotFoundError, PermissionError):
+        return False
+
+    return True
+
+
+if os.name == 'nt' and sys.version_info < (3, 12):
+    from ctypes import windll, wintypes
+
+    _GetFileAttributesW = windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+    _INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+    _FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+    def isdir(path):
+        """
+        Return True if path is an existing directory.
+
+        This calls GetFileAttributesW directly, which is faster than the
+        stat emulation done by osp.isdir on Windows before Python 3.12.
+        """
+        try:
+            path_str = os.fspath(path)
+        except TypeError:
+            return osp.isdir(path)
+
+        # ctypes silently truncates strings at null characters and doesn't
+        # accept bytes, so leave those cases to osp.isdir.
+        if not isinstance(path_str, str) or "\0" in path_str:
+            return osp.isdir(path)
+
+        attributes = _GetFileAttributesW(path_str)
+        if attributes == _INVALID_FILE_ATTRIBUTES:
+            return False
+
+        # GetFileAttributesW doesn't follow symlinks and junctions, so a
+        # dangling one would be reported as a directory.
+        if attributes & _FILE_ATTRIBUTE_REPARSE_POINT:
+            return osp.isdir(path)
+
+        return bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+else:
+    # Python 3.12+ already has a fast implementation on Windows
+    isdir = osp.isdir
+
+
 def memoize(obj):
     """
     Memoize objects to trade memory for execution speed
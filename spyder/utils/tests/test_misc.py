@@ -9,13 +9,16 @@ Tests for misc.py
 """
 
 # Standard library imports
+from contextlib import contextmanager
 import os
+import subprocess
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder.utils.misc import get_common_path
+from spyder.config.base import running_in_ci
+from spyder.utils.misc import get_common_path, is_writable, isdir
 
 
 def test_get_common_path():
@@ -34,5 +37,79 @@ def test_get_common_path():
                                 ]) == '/Python'
 
 
+def test_isdir(tmp_path):
+    """Test that isdir gives the same results as os.path.isdir."""
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    file = tmp_path / "file.txt"
+    file.write_text("foo")
+    missing = tmp_path / "missing"
+
+    paths = [
+        str(directory),
+        str(file),
+        str(missing),
+        str(directory) + "\0foo",
+        directory,
+    ]
+
+    # Dangling symlinks to directories shouldn't be reported as directories
+    dangling_link = tmp_path / "dangling_link"
+    try:
+        os.symlink(str(missing), str(dangling_link), target_is_directory=True)
+    except (OSError, NotImplementedError):
+        # Creating symlinks requires special privileges on Windows
+        pass
+    else:
+        paths.append(str(dangling_link))
+
+    for path in paths:
+        assert isdir(path) == os.path.isdir(path)
+
+    assert isdir(str(directory))
+    assert not isdir(str(directory) + "\0foo")
+
+
+def test_directory_is_writable(tmp_path):
+    """Test if we can correctly detect of a directory is writable."""
+    read_only_dir = tmp_path / "read_only_dir"
+    read_only_dir.mkdir()
+
+    # Make the directory read-only.
+    if os.name == "nt":
+        # From https://stackoverflow.com/a/66130551
+        @contextmanager
+        def set_access_right(path, access):
+            def cmd(access_right):
+                return [
+                    "icacls",
+                    str(path),
+                    "/inheritance:r",
+                    "/grant:r",
+                    f"Everyone:{access_right}",
+                ]
+
+            try:
+                subprocess.check_output(cmd(access))
+                yield path
+            finally:
+                subprocess.check_output(cmd("F")) # F -> full access again
+
+        # This doesn't work on CIs but passes locally
+        if not running_in_ci():
+            with set_access_right(read_only_dir, "R") as path: # R -> Read-only
+                assert not is_writable(str(path))
+
+        # Also check that is_writable can deal with UNC paths.
+        assert not is_writable("\\Users")
+    else:
+        # From https://stackoverflow.com/a/70933772
+        read_only_dir.chmod(0o444)
+        assert not is_writable(str(read_only_dir))
+
+        # Make it read-write again to delete it
+        read_only_dir.chmod(0o644)
+
+
 if __name__ == "__main__":
     pytest.main()
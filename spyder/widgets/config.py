@@ -46,6 +46,7 @@ from spyder.config.base import get_home_dir
 from spyder.config.manager import CONF
 from spyder.config.user import NoDefault
 from spyder.utils.icon_manager import ima
+from spyder.utils.misc import isdir
 from spyder.utils.stylesheet import AppStyle, MAC, WIN
 from spyder.widgets.colors import ColorLayout
 from spyder.widgets.helperwidgets import TipWidget, ValidationLineEdit
@@ -102,6 +103,10 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
     CONF_SECTION = None
     LOAD_FROM_CONFIG = True
 
+    # Icon of browse buttons. It's the same for all pages, so it's created
+    # only once in _get_browse_icon.
+    _BROWSE_ICON = None
+
     def __init__(self, parent):
         SidebarPage.__init__(self, parent)
 
@@ -732,9 +737,9 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
                 break
 
         msg = _("Invalid directory path")
-        self.validate_data[edit] = (osp.isdir, msg)
+        self.validate_data[edit] = (isdir, msg)
 
-        browse_btn = QPushButton(ima.icon('DirOpenIcon'), '', self)
+        browse_btn = QPushButton(self._get_browse_icon(), '', self)
         browse_btn.setToolTip(_("Select directory"))
         browse_btn.clicked.connect(lambda: self.select_directory(edit))
         browse_btn.setIconSize(
@@ -765,12 +770,19 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
 
         browsedir = QWidget(self)
         browsedir.textbox = widget.textbox
+        browsedir.browse_btn = browse_btn
         if status_icon:
             browsedir.status_action = widget.status_action
 
         browsedir.setLayout(layout)
         return browsedir
 
+    def _get_browse_icon(self):
+        """Get the icon used for browse buttons."""
+        if SpyderConfigPage._BROWSE_ICON is None:
+            SpyderConfigPage._BROWSE_ICON = ima.icon('DirOpenIcon')
+        return SpyderConfigPage._BROWSE_ICON
+
     def select_directory(self, edit):
         """Select directory"""
         basedir = str(edit.text())
@@ -806,7 +818,7 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
         msg = _('Invalid file path')
         self.validate_data[edit] = (osp.isfile, msg)
 
-        browse_btn = QPushButton(ima.icon('DirOpenIcon'), '', self)
+        browse_btn = QPushButton(self._get_browse_icon(), '', self)
         browse_btn.setToolTip(_("Select file"))
         browse_btn.clicked.connect(lambda: self.select_file(edit, filters))
         browse_btn.setIconSize(
@@ -1038,7 +1050,7 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
             msg
         )
 
-        browse_btn = QPushButton(ima.icon('DirOpenIcon'), '', self)
+        browse_btn = QPushButton(self._get_browse_icon(), '', self)
         browse_btn.setToolTip(_("Select file"))
         options = QFileDialog.DontResolveSymlinks
         browse_btn.clicked.connect(